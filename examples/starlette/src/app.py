@@ -5,14 +5,88 @@ This server accepts POST requests with multipart/form-data content and
 returns a JSON response with the parsed parts, suitable for conformance testing.
 """
 
-import base64
+import codecs
+from typing import Optional
+
+import orjson
 from starlette.applications import Starlette
+from starlette.datastructures import UploadFile
 from starlette.responses import JSONResponse
 from starlette.routing import Route
 from starlette.requests import Request
 
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that serializes with orjson, which emits bytes directly."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+# Substrings of lowercased error messages and the error type each maps to,
+# checked in order; anything else is reported as "parse_error"
+ERROR_TYPE_MAP = [
+    ("boundary", "boundary_mismatch"),
+    ("content-disposition", "missing_content_disposition"),
+]
 
-async def parse_multipart(request: Request) -> JSONResponse:
+# Uploads are read in chunks; a multiple of 3 so full chunks base64 encode
+# without leaving a remainder to carry over
+UPLOAD_CHUNK_SIZE = 3 * 16 * 1024
+
+
+async def read_upload(upload: UploadFile) -> tuple[int, Optional[str], Optional[str]]:
+    """
+    Stream an uploaded file and return (body_size, body_text, body_base64).
+
+    The body is validated as UTF-8 incrementally. As soon as it turns out not
+    to be valid UTF-8 the file is rewound and base64 encoded chunk by chunk.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    text_chunks = []
+    body_size = 0
+
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        body_size += len(chunk)
+        if chunk.isascii() and not decoder.getstate()[0]:
+            # Pure ASCII with no partial sequence pending can skip UTF-8 validation
+            text_chunks.append(chunk.decode("ascii"))
+            continue
+        try:
+            text_chunks.append(decoder.decode(chunk))
+        except UnicodeDecodeError:
+            break
+    else:
+        try:
+            text_chunks.append(decoder.decode(b"", final=True))
+            return body_size, "".join(text_chunks), None
+        except UnicodeDecodeError:
+            pass
+
+    # Binary content - rewind and base64 encode, sizing it on the way. Bytes
+    # that don't fill a 3-byte group are carried into the next chunk so no
+    # padding ends up in the middle of the output, even after a short read.
+    await upload.seek(0)
+    b64_chunks = []
+    body_size = 0
+    carry = b""
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        body_size += len(chunk)
+        if carry:
+            chunk = carry + chunk
+        cut = len(chunk) - len(chunk) % 3
+        b64_chunks.append(b64encode(chunk[:cut]))
+        carry = chunk[cut:]
+    b64_chunks.append(b64encode(carry))
+    return body_size, None, b"".join(b64_chunks).decode("ascii")
+
+
+async def parse_multipart(request: Request) -> ORJSONResponse:
     """
     Parse multipart/form-data and return JSON with the parsed parts.
 
@@ -25,64 +99,55 @@ async def parse_multipart(request: Request) -> JSONResponse:
         form = await request.form()
         parts = []
 
-        for field_name in form:
-            # form.getlist() returns all values for a field name
-            values = form.getlist(field_name)
-            for value in values:
-                part = {"name": field_name}
-
-                # Check if it's a file upload (UploadFile) or a plain form field
-                if hasattr(value, "filename"):
-                    # It's a file upload
-                    part["filename"] = value.filename if value.filename else None
-                    part["content_type"] = value.content_type if value.content_type else None
-
-                    # Read the file content
-                    content = await value.read()
-                    part["body_size"] = len(content)
-
-                    # Try to decode as text, fall back to base64 for binary
-                    try:
-                        part["body_text"] = content.decode("utf-8")
-                        part["body_base64"] = None
-                    except UnicodeDecodeError:
-                        part["body_text"] = None
-                        part["body_base64"] = base64.b64encode(content).decode("ascii")
-                else:
-                    # It's a plain form field (string value)
-                    part["filename"] = None
-                    part["content_type"] = None
-                    part["body_text"] = value
-                    part["body_base64"] = None
-                    part["body_size"] = len(value.encode("utf-8")) if value else 0
-
-                parts.append(part)
-
-        return JSONResponse({
+        # multi_items() yields every (name, value) pair in submission order
+        for field_name, value in form.multi_items():
+            part = {"name": field_name}
+
+            # Check if it's a file upload (UploadFile) or a plain form field
+            if isinstance(value, UploadFile):
+                # It's a file upload
+                part["filename"] = value.filename if value.filename else None
+                part["content_type"] = value.content_type if value.content_type else None
+
+                # Stream the file content: text if valid UTF-8, base64 otherwise
+                body_size, body_text, body_base64 = await read_upload(value)
+                part["body_size"] = body_size
+                part["body_text"] = body_text
+                part["body_base64"] = body_base64
+            else:
+                # It's a plain form field (string value)
+                part["filename"] = None
+                part["content_type"] = None
+                part["body_text"] = value
+                part["body_base64"] = None
+                # ASCII text is one byte per character, so skip the encode
+                part["body_size"] = len(value) if value.isascii() else len(value.encode("utf-8"))
+
+            parts.append(part)
+
+        return ORJSONResponse({
             "valid": True,
             "parts": parts
         })
     except Exception as e:
-        # Map common exceptions to error types
-        error_type = "parse_error"
+        # Map common exceptions to error types, lowercasing the message once
         error_message = str(e)
+        message_lower = error_message.lower()
+        error_type = next(
+            (t for substring, t in ERROR_TYPE_MAP if substring in message_lower),
+            "parse_error",
+        )
 
-        # Try to identify specific error types
-        if "boundary" in error_message.lower():
-            error_type = "boundary_mismatch"
-        elif "content-disposition" in error_message.lower():
-            error_type = "missing_content_disposition"
-
-        return JSONResponse({
+        return ORJSONResponse({
             "valid": False,
             "error_type": error_type,
             "error_message": error_message
         })
 
 
-async def health_check(request: Request) -> JSONResponse:
+async def health_check(request: Request) -> ORJSONResponse:
     """Health check endpoint."""
-    return JSONResponse({"status": "ok"})
+    return ORJSONResponse({"status": "ok"})
 
 
 app = Starlette(
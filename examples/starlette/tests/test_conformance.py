@@ -6,7 +6,7 @@ a live Starlette/Uvicorn server to verify Starlette's multipart parsing behavior
 """
 
 import base64
-import json
+import os
 import socket
 import subprocess
 import sys
@@ -14,11 +14,19 @@ import time
 from pathlib import Path
 
 import httpx
+import orjson
 import pytest
 
 # Path to the conformance test suite
 TESTS_ROOT = Path(__file__).parent.parent.parent.parent / "tests"
 
+# Parsed (test_json, headers_json, input_raw) tuples keyed by test ID,
+# populated once by collect_test_cases()
+_CASE_CACHE = {}
+
+# Files every test case directory must contain
+REQUIRED_FILES = {"test.json", "headers.json", "input.raw"}
+
 
 def get_unused_port():
     """Find an unused TCP port on localhost."""
@@ -33,25 +41,31 @@ def collect_test_cases():
     """
     Collect all test cases from the tests/ directory.
 
+    Each case is read and parsed once and stored in _CASE_CACHE.
     Returns a list of tuples (test_id, test_dir) for parametrization.
     """
     test_cases = []
 
-    for category_dir in sorted(TESTS_ROOT.iterdir()):
-        if not category_dir.is_dir():
-            continue
+    # scandir entries carry their file type, so no extra stat per entry
+    with os.scandir(TESTS_ROOT) as it:
+        category_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
 
-        for test_dir in sorted(category_dir.iterdir()):
-            if not test_dir.is_dir():
-                continue
+    for category_dir in category_dirs:
+        with os.scandir(category_dir.path) as it:
+            test_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
 
+        for entry in test_dirs:
             # Verify this is a valid test case (has required files)
-            test_json = test_dir / "test.json"
-            headers_json = test_dir / "headers.json"
-            input_raw = test_dir / "input.raw"
+            if not REQUIRED_FILES <= set(os.listdir(entry.path)):
+                continue
 
-            if test_json.exists() and headers_json.exists() and input_raw.exists():
-                test_cases.append((test_dir.name, test_dir))
+            test_dir = Path(entry.path)
+            _CASE_CACHE[test_dir.name] = (
+                orjson.loads((test_dir / "test.json").read_bytes()),
+                orjson.loads((test_dir / "headers.json").read_bytes()),
+                (test_dir / "input.raw").read_bytes(),
+            )
+            test_cases.append((test_dir.name, test_dir))
 
     return test_cases
 
@@ -108,13 +122,16 @@ def server_url():
     proc.wait()
 
 
-def load_test_case(test_dir: Path):
-    """Load test case data from a test directory."""
-    test_json = json.loads((test_dir / "test.json").read_text())
-    headers_json = json.loads((test_dir / "headers.json").read_text())
-    input_raw = (test_dir / "input.raw").read_bytes()
+@pytest.fixture(scope="session")
+def http_client():
+    """Shared HTTP client so all tests reuse one keep-alive connection pool."""
+    with httpx.Client(timeout=10.0) as client:
+        yield client
 
-    return test_json, headers_json, input_raw
+
+def load_test_case(test_dir: Path):
+    """Return the cached test case data for a test directory."""
+    return _CASE_CACHE[test_dir.name]
 
 
 def compare_part(actual: dict, expected: dict, test_id: str):
@@ -191,7 +208,9 @@ def is_optional_test(test_json: dict) -> bool:
 
 
 @pytest.mark.parametrize("test_id,test_dir", TEST_CASES, ids=[tc[0] for tc in TEST_CASES])
-def test_multipart_parsing(server_url: str, test_id: str, test_dir: Path):
+def test_multipart_parsing(
+    server_url: str, http_client: httpx.Client, test_id: str, test_dir: Path
+):
     """
     Test Starlette's multipart parsing against a conformance test case.
     """
@@ -206,13 +225,12 @@ def test_multipart_parsing(server_url: str, test_id: str, test_dir: Path):
 
     # Send the raw multipart body to the server
     try:
-        response = httpx.post(
+        response = http_client.post(
             f"{server_url}/parse",
             content=input_raw,
             headers=headers,
-            timeout=10.0,
         )
-        result = response.json()
+        result = orjson.loads(response.content)
     except Exception as e:
         # HTTP client may reject certain headers (e.g., unusual whitespace)
         if optional:
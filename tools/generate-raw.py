@@ -14,10 +14,14 @@ Usage:
 """
 
 import argparse
-import base64
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+try:
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -44,7 +48,8 @@ class MultipartBuilder:
         self.include_final_terminator = include_final_terminator
         self.preamble = preamble
         self.epilogue = epilogue
-        self.parts: List[bytes] = []
+        # Each part is kept as its header block and body, joined only in build()
+        self.parts: List[Tuple[bytes, ...]] = []
 
     def add_field(
         self,
@@ -55,7 +60,7 @@ class MultipartBuilder:
     ):
         """Add a text field."""
         headers = self._build_headers(name, None, content_type, extra_headers)
-        self.parts.append(headers + value)
+        self.parts.append((headers, value))
 
     def add_file(
         self,
@@ -68,11 +73,11 @@ class MultipartBuilder:
     ):
         """Add a file field."""
         headers = self._build_headers(name, filename, content_type, extra_headers, filename_star)
-        self.parts.append(headers + content)
+        self.parts.append((headers, content))
 
     def add_raw_part(self, raw_bytes: bytes):
         """Add a completely raw part (for malformed tests)."""
-        self.parts.append(raw_bytes)
+        self.parts.append((raw_bytes,))
 
     def _build_headers(
         self,
@@ -103,47 +108,59 @@ class MultipartBuilder:
             for key, value in extra_headers.items():
                 lines.append(f"{key}: {value}".encode('utf-8'))
 
-        # Join headers and add blank line
-        header_block = self.line_ending.join(lines) + self.line_ending + self.line_ending
-        return header_block
+        # Join headers and add blank line: two empty entries give the final
+        # line ending plus the blank line in a single join
+        lines.append(b"")
+        lines.append(b"")
+        return self.line_ending.join(lines)
 
     def build(self) -> bytes:
         """Build the complete multipart message."""
-        result = b""
+        chunks: List[bytes] = []
 
         # Preamble (before first boundary)
         if self.preamble:
-            result += self.preamble
+            chunks.append(self.preamble)
 
         boundary_bytes = f"--{self.boundary}".encode('utf-8')
         final_boundary_bytes = f"--{self.boundary}--".encode('utf-8')
 
         # Each part
+        last = len(self.parts) - 1
         for i, part in enumerate(self.parts):
-            result += boundary_bytes + self.line_ending
-            result += part
+            chunks.append(boundary_bytes)
+            chunks.append(self.line_ending)
+            chunks.extend(part)
             # Add CRLF after part content (before next boundary)
-            if i < len(self.parts) - 1 or self.include_final_terminator:
-                result += self.line_ending
+            if i < last or self.include_final_terminator:
+                chunks.append(self.line_ending)
 
         # Final boundary
         if self.include_final_terminator:
-            result += final_boundary_bytes + self.line_ending
+            chunks.append(final_boundary_bytes)
+            chunks.append(self.line_ending)
 
         # Epilogue (after final boundary)
         if self.epilogue:
-            result += self.epilogue
+            chunks.append(self.epilogue)
+
+        return b"".join(chunks)
+
 
-        return result
+# Maps every byte to itself if printable ASCII, otherwise to "."
+_ASCII_TABLE = bytes(c if 32 <= c < 127 else ord(".") for c in range(256))
 
 
 def hex_dump(data: bytes, width: int = 16) -> str:
     """Generate a hex dump of binary data."""
+    # Convert the whole buffer in two C-level passes, then slice per line.
+    # Each byte is three characters ("xx ") in hex_all, minus the final space.
+    hex_all = data.hex(" ")
+    ascii_all = data.translate(_ASCII_TABLE).decode("ascii")
     lines = []
     for i in range(0, len(data), width):
-        chunk = data[i:i + width]
-        hex_part = " ".join(f"{b:02x}" for b in chunk)
-        ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
+        hex_part = hex_all[i * 3:(i + width) * 3 - 1]
+        ascii_part = ascii_all[i:i + width]
         lines.append(f"{i:08x}  {hex_part:<{width * 3}}  |{ascii_part}|")
     return "\n".join(lines)
 
@@ -152,8 +169,8 @@ def parse_field_args(args: List[str]) -> dict:
     """Parse field arguments like name=value."""
     result = {}
     for arg in args:
-        if '=' in arg:
-            key, value = arg.split('=', 1)
+        key, sep, value = arg.partition('=')
+        if sep:
             result[key] = value
     return result
 
@@ -290,7 +307,7 @@ Examples:
                 else:
                     content = content_spec.encode('utf-8')
             elif "content-base64" in params:
-                content = base64.b64decode(params["content-base64"])
+                content = b64decode(params["content-base64"])
             else:
                 content = b""
 
@@ -299,7 +316,7 @@ Examples:
     # Add raw parts
     if args.raw_part:
         for raw_b64 in args.raw_part:
-            builder.add_raw_part(base64.b64decode(raw_b64))
+            builder.add_raw_part(b64decode(raw_b64))
 
     # Build the message
     result = builder.build()
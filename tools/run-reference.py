@@ -12,27 +12,71 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import re
 import sys
+from bisect import bisect_left
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _print_json(obj: Any):
+        # orjson emits UTF-8 bytes; write them directly so output doesn't
+        # depend on the console encoding
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+except ImportError:
+    _loads = json.loads
+
+    def _print_json(obj: Any):
+        print(json.dumps(obj, indent=2))
+
+
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 from lib.multipart_utils import (
     Part,
     ParseResult,
+    find_boundary_offsets,
+    map_file,
     parse_boundary,
     parse_content_disposition,
     compare_parts,
+    run_ordered,
 )
 
 
-CRLF = b"\r\n"
 LF = b"\n"
 
+CHARSET_PATTERN = re.compile(r"charset=([^\s;]+)", re.IGNORECASE)
+TEST_DIR_PATTERN = re.compile(r"[0-9]{3}-")
+
+
+@functools.lru_cache(maxsize=1024)
+def _boundary_bytes(boundary: str) -> Tuple[bytes, bytes, bytes]:
+    """
+    Return the (delimiter, close_delimiter, search) byte strings for a boundary.
+
+    search is LF + delimiter, the needle find_boundary_offsets() scans for.
+    """
+    delimiter = f"--{boundary}".encode("utf-8")
+    return delimiter, delimiter + b"--", LF + delimiter
+
+
+def _decode_header(value: bytes) -> str:
+    """Decode a header line as UTF-8, falling back to latin-1."""
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError:
+        return value.decode("latin-1")
+
 
 class MultipartParser:
     """
@@ -46,7 +90,12 @@ class MultipartParser:
         self.strict = strict
 
     def parse(self, body: bytes, boundary: str) -> ParseResult:
-        """Parse a multipart/form-data body."""
+        """
+        Parse a multipart/form-data body.
+
+        body may also be a read-only mmap (see map_file); part bodies are
+        copied out as bytes.
+        """
         if not boundary:
             return ParseResult(
                 valid=False,
@@ -55,8 +104,7 @@ class MultipartParser:
             )
 
         # Boundary markers
-        delimiter = f"--{boundary}".encode("utf-8")
-        close_delimiter = f"--{boundary}--".encode("utf-8")
+        delimiter, close_delimiter, search = _boundary_bytes(boundary)
 
         # Find the first boundary
         first_boundary_pos = body.find(delimiter)
@@ -79,6 +127,13 @@ class MultipartParser:
                 error_message="Unexpected end after first boundary",
             )
 
+        # Index every boundary position in one pass over the body
+        boundary_offsets = find_boundary_offsets(body, search, self.strict)
+
+        # Part bodies are zero-copy views into a bytes body. An mmap body is
+        # sliced (copied) instead so the mapping can be closed after parsing.
+        body_view = memoryview(body) if isinstance(body, bytes) else body
+
         parts: List[Part] = []
 
         while pos < len(body):
@@ -93,13 +148,18 @@ class MultipartParser:
 
             pos = header_end
 
-            # Check for Content-Disposition header
-            content_disposition = None
-            for key, value in headers.items():
-                if key.lower() == "content-disposition":
-                    content_disposition = value
-                    break
+            # Part.headers keeps the last of any names differing only in case,
+            # while lookups use the first, so only build a separate lookup
+            # table when such names are present
+            part_headers = {k.lower(): v for k, v in headers.items()}
+            lookup = part_headers
+            if len(part_headers) != len(headers):
+                lookup = {}
+                for key, value in headers.items():
+                    lookup.setdefault(key.lower(), value)
 
+            # Check for Content-Disposition header
+            content_disposition = lookup.get("content-disposition")
             if content_disposition is None:
                 return ParseResult(
                     valid=False,
@@ -117,7 +177,7 @@ class MultipartParser:
                 )
 
             # Find the end of this part (next boundary)
-            body_end = self._find_next_boundary(body, pos, delimiter)
+            body_end = self._find_next_boundary(boundary_offsets, pos)
             if body_end is None:
                 return ParseResult(
                     valid=False,
@@ -126,19 +186,18 @@ class MultipartParser:
                 )
 
             # Extract body (excluding trailing CRLF before boundary)
-            part_body = body[pos:body_end]
+            part_body = body_view[pos:body_end]
 
             # Get Content-Type if present
             content_type = None
             charset = None
-            for key, value in headers.items():
-                if key.lower() == "content-type":
-                    content_type = value.split(";")[0].strip()
-                    # Extract charset if present
-                    charset_match = re.search(r"charset=([^\s;]+)", value, re.IGNORECASE)
-                    if charset_match:
-                        charset = charset_match.group(1).strip('"')
-                    break
+            content_type_value = lookup.get("content-type")
+            if content_type_value is not None:
+                content_type = content_type_value.split(";")[0].strip()
+                # Extract charset if present
+                charset_match = CHARSET_PATTERN.search(content_type_value)
+                if charset_match:
+                    charset = charset_match.group(1).strip('"')
 
             # Create Part object
             part = Part(
@@ -147,7 +206,7 @@ class MultipartParser:
                 filename_star=cd_params.get("filename_star"),
                 content_type=content_type,
                 charset=charset,
-                headers={k.lower(): v for k, v in headers.items()},
+                headers=part_headers,
                 body=part_body,
             )
             parts.append(part)
@@ -155,17 +214,17 @@ class MultipartParser:
             # Move to after the boundary
             pos = body_end
 
-            # Skip the CRLF before boundary
-            if body[pos:pos + 2] == CRLF:
+            # Skip the CRLF before boundary (compare single bytes, no slicing)
+            if body[pos] == 0x0D and body[pos + 1] == 0x0A:
                 pos += 2
-            elif body[pos:pos + 1] == LF and not self.strict:
+            elif body[pos] == 0x0A and not self.strict:
                 pos += 1
 
-            # Skip the boundary itself
-            if body[pos:].startswith(close_delimiter):
+            # Skip the boundary itself, comparing only as many bytes as needed
+            if body[pos:pos + len(close_delimiter)] == close_delimiter:
                 # Final boundary - we're done
                 break
-            elif body[pos:].startswith(delimiter):
+            elif body[pos:pos + len(delimiter)] == delimiter:
                 pos += len(delimiter)
                 # Skip line ending after boundary
                 new_pos = self._skip_line_ending(body, pos)
@@ -180,7 +239,8 @@ class MultipartParser:
                 )
 
         # Check for final terminator
-        if close_delimiter not in body:
+        # find() rather than `in`, which mmap does not support for substrings
+        if body.find(close_delimiter) == -1:
             return ParseResult(
                 valid=False,
                 error_type="missing_terminator",
@@ -192,61 +252,57 @@ class MultipartParser:
 
     def _skip_line_ending(self, body: bytes, pos: int) -> Optional[int]:
         """Skip CRLF or LF (if lenient). Returns new position or None."""
-        if pos >= len(body):
+        n = len(body)
+        if pos >= n:
             return None
 
-        if body[pos:pos + 2] == CRLF:
+        b0 = body[pos]
+        if b0 == 0x0D and pos + 1 < n and body[pos + 1] == 0x0A:
             return pos + 2
-        elif body[pos:pos + 1] == LF and not self.strict:
-            return pos + 1
-        elif body[pos:pos + 1] == LF and self.strict:
-            return None  # Invalid in strict mode
+        elif b0 == 0x0A:
+            return None if self.strict else pos + 1  # Bare LF invalid in strict mode
 
         return pos  # No line ending to skip
 
     def _parse_headers(self, body: bytes, pos: int) -> Tuple[Optional[Dict[str, str]], int]:
         """Parse MIME headers starting at pos. Returns (headers, end_position)."""
         headers: Dict[str, str] = {}
+        last_key: Optional[str] = None
 
         while pos < len(body):
-            # Find end of line
-            crlf_pos = body.find(CRLF, pos)
+            # Find end of line: one search for LF, then check for a preceding CR
             lf_pos = body.find(LF, pos)
+            if lf_pos == -1:
+                # No valid line ending found
+                return None, pos
 
-            if crlf_pos == pos:
-                # Empty line - end of headers
-                return headers, pos + 2
-            elif lf_pos == pos and not self.strict:
-                # Empty line with LF only (lenient mode)
-                return headers, pos + 1
-
-            # Find the line ending
-            if crlf_pos != -1 and (lf_pos == -1 or crlf_pos < lf_pos):
-                line_end = crlf_pos
-                next_pos = crlf_pos + 2
-            elif lf_pos != -1 and not self.strict:
+            if lf_pos > pos and body[lf_pos - 1] == 0x0D:
+                line_end = lf_pos - 1
+            elif not self.strict:
                 line_end = lf_pos
-                next_pos = lf_pos + 1
             else:
-                # No valid line ending found
+                # Bare LF is invalid in strict mode
                 return None, pos
+            next_pos = lf_pos + 1
 
-            # Extract line
-            line = body[pos:line_end]
+            if line_end == pos:
+                # Empty line - end of headers
+                return headers, next_pos
 
-            try:
-                line_str = line.decode("utf-8")
-            except UnicodeDecodeError:
-                line_str = line.decode("latin-1")
+            # Extract and decode line
+            line = _decode_header(body[pos:line_end])
 
             # Parse header
-            if ":" in line_str:
-                name, value = line_str.split(":", 1)
-                headers[name.strip()] = value.strip()
-            elif line_str.startswith((" ", "\t")) and headers:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                name = name.strip()
+                if name not in headers:
+                    # Continuations extend the most recently added name
+                    last_key = name
+                headers[name] = value.strip()
+            elif line.startswith((" ", "\t")) and last_key is not None:
                 # Header continuation (obsolete but handle it)
-                last_key = list(headers.keys())[-1]
-                headers[last_key] += " " + line_str.strip()
+                headers[last_key] += " " + line.strip()
             else:
                 # Invalid header line
                 return None, pos
@@ -255,19 +311,11 @@ class MultipartParser:
 
         return None, pos  # Ran out of data
 
-    def _find_next_boundary(self, body: bytes, pos: int, delimiter: bytes) -> Optional[int]:
+    def _find_next_boundary(self, boundary_offsets: List[int], pos: int) -> Optional[int]:
         """Find the position where the next boundary starts (before CRLF)."""
-        # Look for CRLF + delimiter or LF + delimiter
-        search_crlf = CRLF + delimiter
-        search_lf = LF + delimiter
-
-        crlf_pos = body.find(search_crlf, pos)
-        lf_pos = body.find(search_lf, pos) if not self.strict else -1
-
-        if crlf_pos != -1 and (lf_pos == -1 or crlf_pos <= lf_pos):
-            return crlf_pos
-        elif lf_pos != -1:
-            return lf_pos
+        i = bisect_left(boundary_offsets, pos)
+        if i < len(boundary_offsets):
+            return boundary_offsets[i]
 
         return None
 
@@ -290,8 +338,7 @@ def run_test(test_dir: Path, strict: bool = True) -> Dict[str, Any]:
         result["errors"].append("Missing test.json")
         return result
 
-    with open(test_json, "r") as f:
-        test_data = json.load(f)
+    test_data = _loads(test_json.read_bytes())
 
     # Check if this is a lenient-only test
     tags = test_data.get("tags", [])
@@ -309,21 +356,18 @@ def run_test(test_dir: Path, strict: bool = True) -> Dict[str, Any]:
         result["errors"].append("Missing headers.json")
         return result
 
-    with open(headers_json, "r") as f:
-        headers = json.load(f)
+    headers = _loads(headers_json.read_bytes())
 
     # Load raw body
     if not input_raw.exists():
         result["errors"].append("Missing input.raw")
         return result
 
-    with open(input_raw, "rb") as f:
-        body = f.read()
-
-    # Parse
+    # Parse straight from a read-only mapping of the raw body
     boundary = parse_boundary(headers.get("content-type", ""))
     parser = MultipartParser(strict=strict)
-    parse_result = parser.parse(body, boundary)
+    with map_file(input_raw) as body:
+        parse_result = parser.parse(body, boundary)
 
     result["actual"] = parse_result.to_dict()
 
@@ -359,6 +403,11 @@ def run_test(test_dir: Path, strict: bool = True) -> Dict[str, Any]:
     return result
 
 
+def run_tests(tests: List[Path], strict: bool = True, jobs: int = 1) -> Iterator[Dict[str, Any]]:
+    """Run tests and yield their results in order, across worker processes if jobs > 1."""
+    return run_ordered(functools.partial(run_test, strict=strict), tests, jobs)
+
+
 def find_tests(suite_dir: Path, category: Optional[str] = None) -> List[Path]:
     """Find all test directories."""
     tests_dir = suite_dir / "tests"
@@ -368,13 +417,13 @@ def find_tests(suite_dir: Path, category: Optional[str] = None) -> List[Path]:
         category_dir = tests_dir / category
         if category_dir.exists():
             for test_dir in sorted(category_dir.iterdir()):
-                if test_dir.is_dir() and re.match(r"^\d{3}-", test_dir.name):
+                if test_dir.is_dir() and TEST_DIR_PATTERN.match(test_dir.name):
                     tests.append(test_dir)
     else:
         for category_dir in sorted(tests_dir.iterdir()):
             if category_dir.is_dir():
                 for test_dir in sorted(category_dir.iterdir()):
-                    if test_dir.is_dir() and re.match(r"^\d{3}-", test_dir.name):
+                    if test_dir.is_dir() and TEST_DIR_PATTERN.match(test_dir.name):
                         tests.append(test_dir)
 
     return tests
@@ -414,6 +463,12 @@ def main():
         action="store_true",
         help="Output results as JSON",
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Run tests in this many worker processes (default: 1, in-process)",
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -450,8 +505,7 @@ def main():
     failed = 0
     skipped = 0
 
-    for test_dir in tests:
-        result = run_test(test_dir, strict=strict)
+    for result in run_tests(tests, strict=strict, jobs=args.jobs):
         results.append(result)
 
         if result.get("skipped"):
@@ -478,7 +532,7 @@ def main():
             "skipped": skipped,
             "results": results,
         }
-        print(json.dumps(output, indent=2))
+        _print_json(output)
     else:
         summary = f"\nTotal: {len(results)}, Passed: {passed}, Failed: {failed}"
         if skipped > 0:
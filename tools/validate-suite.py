@@ -11,59 +11,106 @@ Checks:
 """
 
 import argparse
+import io
 import json
+import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Callable, Optional, Iterator
 
 try:
-    import jsonschema
+    # google-re2 matches in linear time; the ID patterns below are written to
+    # behave the same under both engines
+    import re2 as _re
+except ImportError:
+    _re = re
+
+try:
+    from jsonschema import Draft7Validator
     HAS_JSONSCHEMA = True
 except ImportError:
     HAS_JSONSCHEMA = False
 
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+HAS_SCHEMA_VALIDATOR = HAS_JSONSCHEMA or HAS_FASTJSONSCHEMA
+
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
-from lib.multipart_utils import parse_boundary
+from lib.multipart_utils import parse_boundary, run_ordered
+
+# Test directories are NNN-name; test IDs must be NNN-kebab-case (checked
+# with fullmatch, as re2 and re disagree on "$" before a trailing newline)
+TEST_DIR_PATTERN = _re.compile(r"[0-9]{3}-")
+TEST_ID_PATTERN = _re.compile(r"[0-9]{3}-[a-z0-9-]+")
+
+# Expected categories, in reporting order
+CATEGORIES = (
+    "basic",
+    "filenames",
+    "boundaries",
+    "line-endings",
+    "content-types",
+    "edge-cases",
+    "malformed",
+    "browser-variations",
+)
+
+# Bytes read from each end of input.raw before falling back to a full scan
+RAW_SCAN_WINDOW = 4096
 
 
 class ValidationResult:
-    """Holds validation results."""
+    """Holds validation results as (path, message) pairs, formatted on output."""
 
     def __init__(self):
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
+        self.errors: List[Tuple[str, str]] = []
+        self.warnings: List[Tuple[str, str]] = []
         self.tests_checked: int = 0
 
     def add_error(self, path: str, message: str):
-        self.errors.append(f"{path}: {message}")
+        self.errors.append((path, message))
 
     def add_warning(self, path: str, message: str):
-        self.warnings.append(f"{path}: {message}")
+        self.warnings.append((path, message))
+
+    def merge(self, other: "ValidationResult"):
+        """Fold another result (e.g. from a worker process) into this one."""
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.tests_checked += other.tests_checked
 
     @property
     def is_valid(self) -> bool:
         return len(self.errors) == 0
 
     def summary(self) -> str:
-        lines = []
-        lines.append(f"Tests checked: {self.tests_checked}")
-        lines.append(f"Errors: {len(self.errors)}")
-        lines.append(f"Warnings: {len(self.warnings)}")
+        buf = io.StringIO()
+        buf.write(f"Tests checked: {self.tests_checked}\n")
+        buf.write(f"Errors: {len(self.errors)}\n")
+        buf.write(f"Warnings: {len(self.warnings)}")
 
         if self.errors:
-            lines.append("\nErrors:")
-            for err in self.errors:
-                lines.append(f"  - {err}")
+            buf.write("\n\nErrors:")
+            buf.writelines(f"\n  - {path}: {message}" for path, message in self.errors)
 
         if self.warnings:
-            lines.append("\nWarnings:")
-            for warn in self.warnings:
-                lines.append(f"  - {warn}")
+            buf.write("\n\nWarnings:")
+            buf.writelines(f"\n  - {path}: {message}" for path, message in self.warnings)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -71,72 +118,174 @@ class ValidationResult:
             "tests_checked": self.tests_checked,
             "error_count": len(self.errors),
             "warning_count": len(self.warnings),
-            "errors": self.errors,
-            "warnings": self.warnings,
+            "errors": [f"{path}: {message}" for path, message in self.errors],
+            "warnings": [f"{path}: {message}" for path, message in self.warnings],
         }
 
 
-def load_schemas(schema_dir: Path) -> Dict[str, Any]:
-    """Load JSON schemas from schema directory."""
-    schemas = {}
+def _compile_schema(schema: Dict) -> Callable[[Any], List[str]]:
+    """Build a callable that returns a document's schema error messages."""
+    full = None
 
-    test_case_schema = schema_dir / "test-case.schema.json"
-    if test_case_schema.exists():
-        with open(test_case_schema, "r") as f:
-            schemas["test-case"] = json.load(f)
+    def all_errors(data: Any) -> List[str]:
+        return [err.message for err in sorted(full.iter_errors(data), key=lambda err: err.json_path)]
 
-    headers_schema = schema_dir / "headers.schema.json"
-    if headers_schema.exists():
-        with open(headers_schema, "r") as f:
-            schemas["headers"] = json.load(f)
+    if HAS_JSONSCHEMA:
+        Draft7Validator.check_schema(schema)
+        full = Draft7Validator(schema)
 
-    return schemas
+    if HAS_FASTJSONSCHEMA:
+        fast = fastjsonschema.compile(schema)
 
+        def check(data: Any) -> List[str]:
+            try:
+                fast(data)
+            except fastjsonschema.JsonSchemaException as e:
+                if full is None:
+                    return [e.message]
+                return all_errors(data)
+            return []
 
-def validate_json_schema(data: Dict, schema: Dict, path: str, result: ValidationResult):
-    """Validate JSON data against schema."""
-    if not HAS_JSONSCHEMA:
-        result.add_warning(path, "jsonschema not installed, skipping schema validation")
-        return
+        return check
 
-    try:
-        jsonschema.validate(data, schema)
-    except jsonschema.ValidationError as e:
-        result.add_error(path, f"Schema validation failed: {e.message}")
+    return all_errors
 
 
-def validate_test_directory(
-    test_dir: Path,
-    category: str,
-    schemas: Dict[str, Any],
+# Compiled validators keyed by canonical schema JSON, so equivalent schemas
+# (or the same schema loaded again) share one compilation
+_validator_cache: Dict[str, Any] = {}
+
+
+def load_schemas(schema_dir: Path) -> Dict[str, Any]:
+    """Compile every *.schema.json in schema_dir as a validator, keyed by stem."""
+    schemas = {}
+    if not HAS_SCHEMA_VALIDATOR:
+        return schemas
+    suffix = ".schema.json"
+
+    with os.scandir(schema_dir) as it:
+        for entry in it:
+            if entry.name.endswith(suffix) and entry.is_file():
+                schema = _loads(Path(entry.path).read_bytes())
+                key = json.dumps(schema, sort_keys=True)
+                if key not in _validator_cache:
+                    _validator_cache[key] = _compile_schema(schema)
+                schemas[entry.name[:-len(suffix)]] = _validator_cache[key]
+
+    return schemas
+
+
+def validate_json_schema(
+    data: Dict,
+    validator: Callable[[Any], List[str]],
+    path: str,
     result: ValidationResult,
-    seen_ids: set,
 ):
-    """Validate a single test directory."""
+    """Validate JSON data against a validator built by load_schemas."""
+    for message in validator(data):
+        result.add_error(path, f"Schema validation failed: {message}")
+
+
+class RawInput:
+    """The first and last RAW_SCAN_WINDOW bytes of an input.raw file."""
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        with open(path, "rb") as f:
+            if size <= 2 * RAW_SCAN_WINDOW:
+                self.head = self.tail = f.read()
+                self.complete = True
+            else:
+                self.head = f.read(RAW_SCAN_WINDOW)
+                f.seek(size - RAW_SCAN_WINDOW)
+                self.tail = f.read()
+                self.complete = False
+
+    def contains(self, needle: bytes, from_end: bool = False) -> bool:
+        """Check for needle near one end, falling back to a full scan on a miss."""
+        # The close delimiter normally ends the body, optionally followed by
+        # a line break, so try that before searching the tail window
+        if from_end and self.tail.endswith((needle, needle + b"\r\n", needle + b"\n")):
+            return True
+        if needle in (self.tail if from_end else self.head):
+            return True
+        if self.complete:
+            return False
+        with open(self.path, "rb") as f:
+            return needle in f.read()
+
+
+def _read_json(path: str) -> Any:
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+# A test's own result, the ID it declares (None if test.json is unusable) and
+# the index in its errors where a duplicate-ID error belongs; uniqueness is
+# checked by the caller, which sees every test
+TestOutcome = Tuple[ValidationResult, Optional[str], int]
+
+
+def _load_test(
+    test_dir: Path,
+    result: ValidationResult,
+) -> Optional[Tuple[Dict, Optional[Dict], Optional[RawInput], Optional[str]]]:
+    """Load (test_data, headers_data, raw, boundary), or None if test.json is unusable."""
     rel_path = test_dir.name
 
-    # Check required files exist
-    test_json = test_dir / "test.json"
-    headers_json = test_dir / "headers.json"
-    input_raw = test_dir / "input.raw"
+    # Check required files exist, listing the directory once rather than
+    # stat-ing each file; entry paths are plain strings, so no Path joins
+    entries = {entry.name: entry for entry in os.scandir(test_dir)}
+    raw_entry = entries.get("input.raw")
 
-    if not test_json.exists():
+    if "test.json" not in entries:
         result.add_error(rel_path, "Missing test.json")
-        return
+        return None
 
-    if not headers_json.exists():
+    if "headers.json" not in entries:
         result.add_error(rel_path, "Missing headers.json")
 
-    if not input_raw.exists():
+    if raw_entry is None:
         result.add_error(rel_path, "Missing input.raw")
 
-    # Load and validate test.json
     try:
-        with open(test_json, "r") as f:
-            test_data = json.load(f)
+        test_data = _read_json(entries["test.json"].path)
     except json.JSONDecodeError as e:
         result.add_error(rel_path, f"Invalid JSON in test.json: {e}")
-        return
+        return None
+
+    headers_data = None
+    boundary = None
+    if "headers.json" in entries:
+        try:
+            headers_data = _read_json(entries["headers.json"].path)
+        except json.JSONDecodeError as e:
+            result.add_error(rel_path, f"Invalid JSON in headers.json: {e}")
+        else:
+            boundary = parse_boundary(headers_data.get("content-type", ""))
+
+    # input.raw is only inspected for valid tests; malformed tests may
+    # intentionally have mismatched boundaries or no terminator
+    raw = None
+    if raw_entry is not None and test_data.get("expected", {}).get("valid", True):
+        raw = RawInput(raw_entry.path, raw_entry.stat().st_size)
+
+    return test_data, headers_data, raw, boundary
+
+
+def validate_test_directory(
+    test_dir: Path,
+    category: str,
+    schemas: Dict[str, Any],
+) -> TestOutcome:
+    """Validate a single test directory, returning a TestOutcome."""
+    result = ValidationResult()
+    rel_path = test_dir.name
+
+    loaded = _load_test(test_dir, result)
+    if loaded is None:
+        return result, None, 0
+    test_data, headers_data, raw, boundary = loaded
 
     # Validate against schema
     if "test-case" in schemas:
@@ -147,13 +296,11 @@ def validate_test_directory(
     if test_id != test_dir.name:
         result.add_error(rel_path, f"ID '{test_id}' doesn't match directory name '{test_dir.name}'")
 
-    # Check ID uniqueness
-    if test_id in seen_ids:
-        result.add_error(rel_path, f"Duplicate test ID: {test_id}")
-    seen_ids.add(test_id)
+    # ID uniqueness is checked by the caller; remember where its error goes
+    id_error_index = len(result.errors)
 
     # Check ID format (NNN-kebab-case)
-    if not re.match(r"^\d{3}-[a-z0-9-]+$", test_id):
+    if not TEST_ID_PATTERN.fullmatch(test_id):
         result.add_error(rel_path, f"Invalid ID format: {test_id} (expected NNN-kebab-case)")
 
     # Check category matches parent directory
@@ -165,55 +312,65 @@ def validate_test_directory(
         )
 
     # Validate headers.json
-    if headers_json.exists():
-        try:
-            with open(headers_json, "r") as f:
-                headers_data = json.load(f)
-
-            if "headers" in schemas:
-                validate_json_schema(headers_data, schemas["headers"], f"{rel_path}/headers.json", result)
-
-            # Check boundary consistency (skip for invalid/malformed tests)
-            content_type = headers_data.get("content-type", "")
-            boundary = parse_boundary(content_type)
-            expected_valid = test_data.get("expected", {}).get("valid", True)
-
-            if not boundary:
-                result.add_error(rel_path, "Cannot extract boundary from Content-Type header")
-            elif input_raw.exists() and expected_valid:
-                # Only check boundary consistency for valid tests
-                # Malformed tests may intentionally have mismatched boundaries
-                with open(input_raw, "rb") as f:
-                    raw_content = f.read()
-
-                boundary_bytes = f"--{boundary}".encode("utf-8")
-                if boundary_bytes not in raw_content:
-                    result.add_error(
-                        rel_path,
-                        f"Boundary '{boundary}' not found in input.raw",
-                    )
-
-        except json.JSONDecodeError as e:
-            result.add_error(rel_path, f"Invalid JSON in headers.json: {e}")
+    if headers_data is not None:
+        if "headers" in schemas:
+            validate_json_schema(headers_data, schemas["headers"], f"{rel_path}/headers.json", result)
+
+        # Check boundary consistency (skip for invalid/malformed tests)
+        if not boundary:
+            result.add_error(rel_path, "Cannot extract boundary from Content-Type header")
+        elif raw is not None:
+            boundary_bytes = f"--{boundary}".encode("utf-8")
+            if not raw.contains(boundary_bytes):
+                result.add_error(
+                    rel_path,
+                    f"Boundary '{boundary}' not found in input.raw",
+                )
 
     # Check raw file for basic structure (if valid test)
-    if input_raw.exists() and test_data.get("expected", {}).get("valid", True):
-        with open(input_raw, "rb") as f:
-            raw_content = f.read()
-
+    if raw is not None:
         # Check for boundary terminator (unless testing missing terminator)
         expected = test_data.get("expected", {})
         if expected.get("valid", True) or expected.get("error_type") != "missing_terminator":
-            boundary = parse_boundary(headers_data.get("content-type", "") if headers_json.exists() else "")
             if boundary:
                 terminator = f"--{boundary}--".encode("utf-8")
-                if terminator not in raw_content:
+                if not raw.contains(terminator, from_end=True):
                     result.add_warning(rel_path, "Final boundary terminator (--boundary--) not found")
 
     result.tests_checked += 1
+    return result, test_id, id_error_index
+
 
+# Schemas used by _validate_in_worker. Pool workers build their own in
+# _init_worker, since compiled validators can't be pickled
+_worker_schemas: Dict[str, Any] = {}
 
-def validate_suite(suite_dir: Path) -> ValidationResult:
+
+def _init_worker(schema_dir: Path):
+    global _worker_schemas
+    _worker_schemas = load_schemas(schema_dir) if schema_dir.exists() else {}
+
+
+def _validate_in_worker(task: Tuple[Path, str]) -> TestOutcome:
+    test_dir, category = task
+    return validate_test_directory(test_dir, category, _worker_schemas)
+
+
+def validate_tests(
+    tasks: List[Tuple[Path, str]],
+    schemas: Dict[str, Any],
+    schema_dir: Path,
+    jobs: int = 1,
+) -> Iterator[TestOutcome]:
+    """Validate (test_dir, category) pairs in order, across worker processes if jobs > 1."""
+    global _worker_schemas
+    _worker_schemas = schemas
+    return run_ordered(
+        _validate_in_worker, tasks, jobs, initializer=_init_worker, initargs=(schema_dir,)
+    )
+
+
+def validate_suite(suite_dir: Path, jobs: int = 1) -> ValidationResult:
     """Validate the entire test suite."""
     result = ValidationResult()
     seen_ids: set = set()
@@ -222,7 +379,9 @@ def validate_suite(suite_dir: Path) -> ValidationResult:
     schema_dir = suite_dir / "schema"
     schemas = load_schemas(schema_dir) if schema_dir.exists() else {}
 
-    if not schemas:
+    if not HAS_SCHEMA_VALIDATOR:
+        result.add_warning("schema/", "jsonschema not installed, skipping schema validation")
+    elif not schemas:
         result.add_warning("schema/", "No schemas found, skipping schema validation")
 
     # Find all test directories
@@ -231,28 +390,48 @@ def validate_suite(suite_dir: Path) -> ValidationResult:
         result.add_error("tests/", "Tests directory not found")
         return result
 
-    # Expected categories
-    categories = [
-        "basic",
-        "filenames",
-        "boundaries",
-        "line-endings",
-        "content-types",
-        "edge-cases",
-        "malformed",
-        "browser-variations",
-    ]
-
-    for category in categories:
-        category_dir = tests_dir / category
-        if not category_dir.exists():
+    # List tests/ once; categories are then looked up by name
+    with os.scandir(tests_dir) as it:
+        present = {e.name: e for e in it if e.is_dir()}
+
+    # Collect every test first so they can be validated in parallel; None
+    # marks a missing category so its warning keeps its place in the output
+    plan: List[Tuple[str, Optional[List[Path]]]] = []
+    for category in CATEGORIES:
+        category_entry = present.get(category)
+        if category_entry is None:
+            plan.append((category, None))
+            continue
+
+        # Find test directories (NNN-name format); scandir entries carry the
+        # file type, so only matching directories become Path objects
+        with os.scandir(category_entry.path) as it:
+            entries = sorted(
+                (e for e in it if TEST_DIR_PATTERN.match(e.name) and e.is_dir()),
+                key=lambda e: e.name,
+            )
+        plan.append((category, [Path(e.path) for e in entries]))
+
+    tasks = [(test_dir, category) for category, test_dirs in plan for test_dir in test_dirs or ()]
+    outcomes = validate_tests(tasks, schemas, schema_dir, jobs=jobs)
+
+    for category, test_dirs in plan:
+        if test_dirs is None:
             result.add_warning(f"tests/{category}/", "Category directory not found")
             continue
 
-        # Find test directories (NNN-name format)
-        for test_dir in sorted(category_dir.iterdir()):
-            if test_dir.is_dir() and re.match(r"^\d{3}-", test_dir.name):
-                validate_test_directory(test_dir, category, schemas, result, seen_ids)
+        for test_dir in test_dirs:
+            test_result, test_id, id_error_index = next(outcomes)
+
+            # Check ID uniqueness across the suite
+            if test_id is not None:
+                if test_id in seen_ids:
+                    test_result.errors.insert(
+                        id_error_index, (test_dir.name, f"Duplicate test ID: {test_id}")
+                    )
+                seen_ids.add(test_id)
+
+            result.merge(test_result)
 
     return result
 
@@ -275,6 +454,12 @@ def main():
         action="store_true",
         help="Only output errors",
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Validate tests in this many worker processes (default: 1, in-process)",
+    )
 
     args = parser.parse_args()
 
@@ -285,7 +470,7 @@ def main():
         print(f"Error: {suite_dir} doesn't appear to be a test suite root", file=sys.stderr)
         sys.exit(1)
 
-    result = validate_suite(suite_dir)
+    result = validate_suite(suite_dir, jobs=args.jobs)
 
     if args.json:
         print(json.dumps(result.to_dict(), indent=2))